@@ -7,6 +7,8 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
+import functools
+import itertools
 import logging
 import re
 import sys
@@ -22,6 +24,7 @@ from .blocked_pr_scanner import BlockedPRScanner  # noqa: TC003
 from .exceptions import FileAccessError, GitHubAPIError, ResourceNotFoundError
 from .git_config import GitConfigMode
 from .github_client import GitHubClient
+from .graphql_queries import BULK_PR_COMMITS_TEMPLATE, PR_COMMIT_FRAGMENT
 from .models import GitHubFixResult  # noqa: TC001
 from .pr_scanner import PRScanner  # noqa: TC003
 from .progress_tracker import ProgressTracker  # noqa: TC003
@@ -1457,6 +1460,16 @@ async def get_first_commit_info(
         return None
 
 
+# Known commit trailer keys, compiled once as a single alternation so
+# parse_commit_message does one regex check per line instead of looping
+# over thirteen patterns per call.
+_TRAILER_RE = re.compile(
+    r"^(?:Signed-off-by|Co-authored-by|Reviewed-by|Tested-by|Acked-by"
+    r"|Cc|Reported-by|Suggested-by|Fixes|See-also|Link|Bug|Change-Id):",
+    re.IGNORECASE,
+)
+
+
 def parse_commit_message(message: str) -> tuple[str, str]:
     """Parse a commit message into subject and body.
 
@@ -1483,24 +1496,6 @@ def parse_commit_message(message: str) -> tuple[str, str]:
     while body_lines and not body_lines[0].strip():
         body_lines.pop(0)
 
-    # Remove trailers from the end
-    # Common trailer patterns
-    trailer_patterns = [
-        r"^Signed-off-by:",
-        r"^Co-authored-by:",
-        r"^Reviewed-by:",
-        r"^Tested-by:",
-        r"^Acked-by:",
-        r"^Cc:",
-        r"^Reported-by:",
-        r"^Suggested-by:",
-        r"^Fixes:",
-        r"^See-also:",
-        r"^Link:",
-        r"^Bug:",
-        r"^Change-Id:",
-    ]
-
     # Find where trailers start (from the end)
     trailer_start_idx = len(body_lines)
 
@@ -1511,14 +1506,7 @@ def parse_commit_message(message: str) -> tuple[str, str]:
         if not line:
             continue
 
-        # Check if this line is a trailer
-        is_trailer = False
-        for pattern in trailer_patterns:
-            if re.match(pattern, line, re.IGNORECASE):
-                is_trailer = True
-                break
-
-        if is_trailer:
+        if _TRAILER_RE.match(line):
             # This line and everything after is a trailer
             trailer_start_idx = i
         else:
@@ -1537,6 +1525,101 @@ def parse_commit_message(message: str) -> tuple[str, str]:
     return subject, body
 
 
+@functools.lru_cache(maxsize=4096)
+def _normalize_title(title: str) -> str:
+    """Normalize a title for comparison.
+
+    Memoized because automated PRs (renovate, dependabot) repeat the
+    same handful of titles across hundreds of PRs, so normalization
+    collapses to a single strip/casefold per distinct title.
+
+    Args:
+        title: PR title or commit headline
+
+    Returns:
+        Whitespace-stripped, casefolded title
+    """
+    return title.strip().casefold()
+
+
+async def bulk_check_pr_titles(
+    client: GitHubClient,
+    owner: str,
+    repo: str,
+    pr_list: list[dict[str, Any]],
+    batch_size: int = 10,
+    max_concurrency: int = 4,
+) -> list[tuple[dict[str, Any], str, str]]:
+    """Find PRs whose title differs from their first commit's headline.
+
+    Uses GraphQL aliases to fetch commit headlines for up to batch_size
+    PRs per request instead of one round-trip per PR, with batches
+    issued concurrently so wall-clock time is bounded by the slowest
+    batch rather than the sum of all round-trips.
+
+    Args:
+        client: GitHub API client
+        owner: Repository owner
+        repo: Repository name
+        pr_list: PR dicts with at least "number" and "title" keys
+        batch_size: Maximum number of PRs per GraphQL request
+        max_concurrency: Maximum number of batches in flight at once
+
+    Returns:
+        List of (pr, current_title, expected_title) tuples for PRs
+        whose title does not match the first commit's headline
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _check_batch(
+        batch: list[dict[str, Any]],
+    ) -> list[tuple[dict[str, Any], str, str]]:
+        # The templates contain GraphQL braces, so substitute the
+        # placeholders with replace() rather than str.format()
+        pr_queries = "".join(
+            PR_COMMIT_FRAGMENT.replace("{number}", str(pr["number"]))
+            for pr in batch
+        )
+        query = BULK_PR_COMMITS_TEMPLATE.replace("{pr_queries}", pr_queries)
+
+        async with semaphore:
+            try:
+                result = await client.graphql(
+                    query, variables={"owner": owner, "name": repo}
+                )
+            except Exception as e:
+                console.print(f"[red]Error fetching PR commits: {e}[/red]")
+                return []
+
+        repository = result.get("repository") or {}
+        # Key the response nodes by PR number in one pass so the
+        # mismatch check below is a dict lookup, not a nested scan
+        headlines = {
+            node["number"]: node["commits"]["nodes"][0]["commit"][
+                "messageHeadline"
+            ]
+            for node in repository.values()
+            if node and node.get("commits", {}).get("nodes")
+        }
+
+        return [
+            (pr, pr["title"], headlines[pr["number"]])
+            for pr in batch
+            if pr["number"] in headlines
+            and _normalize_title(pr["title"])
+            != _normalize_title(headlines[pr["number"]])
+        ]
+
+    batches = [
+        pr_list[start : start + batch_size]
+        for start in range(0, len(pr_list), batch_size)
+    ]
+    batch_results = await asyncio.gather(
+        *(_check_batch(batch) for batch in batches)
+    )
+    return list(itertools.chain.from_iterable(batch_results))
+
+
 async def update_pr_title(
     client: GitHubClient,
     owner: str,
@@ -9,7 +9,10 @@ performing regex-based search/replace operations on their content.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import mmap
+import os
 from pathlib import Path  # noqa: TC003
 import re
 from typing import TYPE_CHECKING
@@ -17,6 +20,16 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+# Files at or above this size are read through mmap instead of the
+# buffered text I/O stack (see FileFixer._read_text)
+_MMAP_THRESHOLD = 64 * 1024
+
+# Recognizes file patterns of the form ".*\.ext$" or ".*\.(ext1|ext2)$"
+# so find_files can dispatch them to rglob instead of a regex walk
+_SIMPLE_EXT_PATTERN = re.compile(
+    r"^\.\*\\\.(?:([a-z0-9]+)|\(([a-z0-9|]+)\))\$$"
+)
+
 
 class FileFixer:
     """Handles regex-based file content modifications."""
@@ -25,21 +38,81 @@ class FileFixer:
         """Initialize the file fixer."""
         self.logger = logging.getLogger("pull_request_fixer.file_fixer")
 
-    def find_files(self, root_dir: Path, file_pattern: str) -> list[Path]:
+    def _read_text(self, file_path: Path) -> str:
+        """Read a file as UTF-8, using mmap for large files.
+
+        Files at or above _MMAP_THRESHOLD bytes are mapped read-only
+        and decoded straight from the page cache, avoiding one
+        userspace copy through the buffered I/O layer. Smaller files
+        (and anything we cannot stat) use the plain read path.
+
+        Args:
+            file_path: Path to file to read
+
+        Returns:
+            Decoded file content
+        """
+        try:
+            size = file_path.stat().st_size
+        except OSError:
+            size = 0
+
+        if size < _MMAP_THRESHOLD:
+            return file_path.read_text(encoding="utf-8")
+
+        try:
+            with (
+                open(file_path, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            ):
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return mm[:].decode("utf-8")
+        except (OSError, ValueError):
+            # Mapping can fail on exotic filesystems; fall back to the
+            # plain read path
+            return file_path.read_text(encoding="utf-8")
+
+    def find_files(
+        self, root_dir: Path, file_pattern: str | re.Pattern[str]
+    ) -> list[Path]:
         """Find files matching a regex pattern.
 
         Args:
             root_dir: Root directory to search from
-            file_pattern: Regex pattern to match file paths (relative to root)
+            file_pattern: Regex pattern (string or pre-compiled) to match
+                file paths (relative to root)
 
         Returns:
             List of matching file paths
         """
-        try:
-            pattern = re.compile(file_pattern)
-        except re.error as e:
-            self.logger.error(f"Invalid file pattern regex: {e}")
-            return []
+        if isinstance(file_pattern, re.Pattern):
+            pattern = file_pattern
+        else:
+            # Fast path: plain extension patterns reduce to glob
+            # matching, which skips the regex engine entirely
+            ext_match = _SIMPLE_EXT_PATTERN.match(file_pattern)
+            if ext_match:
+                extensions = (ext_match.group(1) or ext_match.group(2)).split(
+                    "|"
+                )
+                ext_files = [
+                    path
+                    for extension in extensions
+                    for path in sorted(root_dir.rglob(f"*.{extension}"))
+                    if path.is_file()
+                ]
+                self.logger.debug(
+                    f"Found {len(ext_files)} files matching pattern "
+                    f"'{file_pattern}' (extension fast path)"
+                )
+                return ext_files
+
+            try:
+                pattern = re.compile(file_pattern)
+            except re.error as e:
+                self.logger.error(f"Invalid file pattern regex: {e}")
+                return []
 
         matching_files: list[Path] = []
 
@@ -71,7 +144,7 @@ class FileFixer:
     def apply_fix(
         self,
         file_path: Path,
-        search_pattern: str,
+        search_pattern: str | re.Pattern[str],
         replacement: str | Callable[[re.Match[str]], str],
         *,
         dry_run: bool = False,
@@ -80,7 +153,9 @@ class FileFixer:
 
         Args:
             file_path: Path to file to modify
-            search_pattern: Regex pattern to search for
+            search_pattern: Regex pattern to search for; pre-compiled
+                patterns are used as-is (with their own flags), strings
+                are compiled with re.MULTILINE
             replacement: Replacement string or function
             dry_run: If True, don't write changes
 
@@ -89,17 +164,20 @@ class FileFixer:
         """
         try:
             # Read original content
-            original_content = file_path.read_text(encoding="utf-8")
+            original_content = self._read_text(file_path)
         except Exception as e:
             self.logger.error(f"Error reading {file_path}: {e}")
             return False, "", ""
 
-        try:
-            # Compile pattern
-            pattern = re.compile(search_pattern, re.MULTILINE)
-        except re.error as e:
-            self.logger.error(f"Invalid search pattern regex: {e}")
-            return False, original_content, original_content
+        if isinstance(search_pattern, re.Pattern):
+            pattern = search_pattern
+        else:
+            try:
+                # Compile pattern
+                pattern = re.compile(search_pattern, re.MULTILINE)
+            except re.error as e:
+                self.logger.error(f"Invalid search pattern regex: {e}")
+                return False, original_content, original_content
 
         # Apply replacement
         try:
@@ -127,13 +205,185 @@ class FileFixer:
 
         return True, original_content, new_content
 
+    async def apply_fix_async(
+        self,
+        file_path: Path,
+        search_pattern: str | re.Pattern[str],
+        replacement: str | Callable[[re.Match[str]], str],
+        *,
+        dry_run: bool = False,
+    ) -> tuple[bool, str, str]:
+        """Async variant of apply_fix running in a worker thread.
+
+        Lets callers overlap the blocking read/modify/write cycles of
+        independent files, e.g. via asyncio.gather. Fixes to the same
+        file must still be applied sequentially.
+
+        Args:
+            file_path: Path to file to modify
+            search_pattern: Regex pattern to search for (see apply_fix)
+            replacement: Replacement string or function
+            dry_run: If True, don't write changes
+
+        Returns:
+            Tuple of (was_modified, original_content, new_content)
+        """
+        return await asyncio.to_thread(
+            self.apply_fix,
+            file_path,
+            search_pattern,
+            replacement,
+            dry_run=dry_run,
+        )
+
+    def apply_fixes(
+        self,
+        file_path: Path,
+        fixes: list[
+            tuple[
+                str | re.Pattern[str],
+                str | Callable[[re.Match[str]], str],
+            ]
+        ],
+        *,
+        dry_run: bool = False,
+    ) -> tuple[bool, str, str]:
+        """Apply multiple regex search/replace operations in one pass.
+
+        All substitutions share a single read/write cycle, so the file
+        is read and written at most once regardless of how many fixes
+        are applied. Fixes apply in order: later patterns see the
+        output of earlier substitutions.
+
+        Args:
+            file_path: Path to file to modify
+            fixes: List of (search_pattern, replacement) tuples; patterns
+                follow the same rules as apply_fix
+            dry_run: If True, don't write changes
+
+        Returns:
+            Tuple of (was_modified, original_content, new_content)
+        """
+        try:
+            original_content = self._read_text(file_path)
+        except Exception as e:
+            self.logger.error(f"Error reading {file_path}: {e}")
+            return False, "", ""
+
+        new_content = original_content
+        for search_pattern, replacement in fixes:
+            if isinstance(search_pattern, re.Pattern):
+                pattern = search_pattern
+            else:
+                try:
+                    pattern = re.compile(search_pattern, re.MULTILINE)
+                except re.error as e:
+                    self.logger.error(f"Invalid search pattern regex: {e}")
+                    return False, original_content, original_content
+
+            try:
+                new_content = pattern.sub(replacement, new_content)
+            except Exception as e:
+                self.logger.error(f"Error applying replacement: {e}")
+                return False, original_content, original_content
+
+        # Check if content changed
+        if new_content == original_content:
+            self.logger.debug(f"No changes needed for {file_path}")
+            return False, original_content, new_content
+
+        # Write changes if not dry run
+        if not dry_run:
+            try:
+                file_path.write_text(new_content, encoding="utf-8")
+                self.logger.debug(f"Modified {file_path}")
+            except Exception as e:
+                self.logger.error(f"Error writing {file_path}: {e}")
+                return False, original_content, original_content
+
+        return True, original_content, new_content
+
+    def batch_apply(
+        self,
+        paths: list[Path],
+        search_pattern: str | re.Pattern[str],
+        replacement: str,
+        *,
+        dry_run: bool = False,
+    ) -> list[Path]:
+        """Apply one regex search/replace across many files.
+
+        The pattern is compiled once and each file is processed with
+        raw os-level reads and writes, skipping the buffered text I/O
+        stack. This amortizes per-file overhead when fixing large
+        batches of files with the same pattern.
+
+        Args:
+            paths: Files to modify
+            search_pattern: Regex pattern to search for; pre-compiled
+                patterns are used as-is, strings are compiled with
+                re.MULTILINE
+            replacement: Replacement string
+            dry_run: If True, don't write changes
+
+        Returns:
+            List of paths that were modified
+        """
+        if isinstance(search_pattern, re.Pattern):
+            pattern = search_pattern
+        else:
+            try:
+                pattern = re.compile(search_pattern, re.MULTILINE)
+            except re.error as e:
+                self.logger.error(f"Invalid search pattern regex: {e}")
+                return []
+
+        modified: list[Path] = []
+        for file_path in paths:
+            try:
+                fd = os.open(file_path, os.O_RDONLY)
+                try:
+                    data = os.read(fd, os.fstat(fd).st_size)
+                finally:
+                    os.close(fd)
+                original_content = data.decode("utf-8")
+            except Exception as e:
+                self.logger.error(f"Error reading {file_path}: {e}")
+                continue
+
+            new_content = pattern.sub(replacement, original_content)
+            if new_content == original_content:
+                continue
+
+            if not dry_run:
+                try:
+                    fd = os.open(file_path, os.O_WRONLY | os.O_TRUNC)
+                    try:
+                        # POSIX permits short writes; loop until the
+                        # whole buffer is on disk
+                        data = new_content.encode("utf-8")
+                        view = memoryview(data)
+                        while view:
+                            view = view[os.write(fd, view) :]
+                    finally:
+                        os.close(fd)
+                    self.logger.debug(f"Modified {file_path}")
+                except Exception as e:
+                    self.logger.error(f"Error writing {file_path}: {e}")
+                    continue
+
+            modified.append(file_path)
+
+        self.logger.debug(f"Batch modified {len(modified)} file(s)")
+        return modified
+
     def remove_lines_matching(
         self,
         file_path: Path,
-        line_pattern: str,
+        line_pattern: str | re.Pattern[str],
         *,
-        context_start: str | None = None,
-        context_end: str | None = None,
+        context_start: str | re.Pattern[str] | None = None,
+        context_end: str | re.Pattern[str] | None = None,
         dry_run: bool = False,
     ) -> tuple[bool, str, str]:
         """Remove lines matching a pattern, optionally within a context.
@@ -143,7 +393,8 @@ class FileFixer:
 
         Args:
             file_path: Path to file to modify
-            line_pattern: Regex pattern to match lines to remove
+            line_pattern: Regex pattern (string or pre-compiled) to match
+                lines to remove
             context_start: Optional regex to define context start (e.g., "inputs:")
             context_end: Optional regex to define context end (e.g., "runs:")
             dry_run: If True, don't write changes
@@ -152,7 +403,7 @@ class FileFixer:
             Tuple of (was_modified, original_content, new_content)
         """
         try:
-            original_content = file_path.read_text(encoding="utf-8")
+            original_content = self._read_text(file_path)
         except Exception as e:
             self.logger.error(f"Error reading {file_path}: {e}")
             return False, "", ""
@@ -160,33 +411,60 @@ class FileFixer:
         lines = original_content.splitlines(keepends=True)
         new_lines: list[str] = []
 
+        def _source(pattern: str | re.Pattern[str]) -> tuple[str, int]:
+            if isinstance(pattern, re.Pattern):
+                return pattern.pattern, pattern.flags
+            return pattern, 0
+
+        # Fuse the line and context patterns into one alternation with
+        # named groups so each line is scanned once instead of up to
+        # three times. Context branches come before the target branch:
+        # alternation picks the leftmost branch at a given position, so
+        # a broad target pattern must not shadow a context marker that
+        # matches the same line
         try:
-            line_regex = re.compile(line_pattern)
-            context_start_regex = (
-                re.compile(context_start) if context_start else None
-            )
-            context_end_regex = re.compile(context_end) if context_end else None
+            line_src, flags = _source(line_pattern)
+            alternatives = []
+            if context_start is not None:
+                start_src, start_flags = _source(context_start)
+                alternatives.append(f"(?P<start>{start_src})")
+                flags |= start_flags
+            if context_end is not None:
+                end_src, end_flags = _source(context_end)
+                alternatives.append(f"(?P<end>{end_src})")
+                flags |= end_flags
+            alternatives.append(f"(?P<target>{line_src})")
+            combined_regex = re.compile("|".join(alternatives), flags)
         except re.error as e:
             self.logger.error(f"Invalid regex pattern: {e}")
             return False, original_content, original_content
 
-        in_context = context_start_regex is None  # If no context, always active
+        in_context = context_start is None  # If no context, always active
         removed_count = 0
 
         for line in lines:
+            # groupdict (rather than lastgroup) keeps this correct when
+            # caller patterns contain their own named groups
+            matched = {
+                name
+                for m in combined_regex.finditer(line)
+                for name, value in m.groupdict().items()
+                if value is not None
+            }
+
             # Check for context markers
-            if context_start_regex and context_start_regex.search(line):
+            if "start" in matched:
                 in_context = True
                 new_lines.append(line)
                 continue
 
-            if context_end_regex and context_end_regex.search(line):
+            if "end" in matched:
                 in_context = False
                 new_lines.append(line)
                 continue
 
             # Check if line should be removed
-            if in_context and line_regex.search(line):
+            if in_context and "target" in matched:
                 removed_count += 1
                 self.logger.debug(f"Removing line: {line.rstrip()}")
                 continue
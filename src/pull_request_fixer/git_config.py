@@ -5,12 +5,24 @@
 
 from __future__ import annotations
 
+import configparser
+import functools
 import logging
-from pathlib import Path  # noqa: TC003
+from pathlib import Path
 import subprocess
+from typing import TYPE_CHECKING
+
+from .exceptions import GitOperationError
+
+if TYPE_CHECKING:
+    import os
 
 logger = logging.getLogger(__name__)
 
+# Single command used to snapshot the global git config; lookups are
+# served from the cached snapshot instead of per-key subprocesses.
+_GIT_CONFIG_LIST_CMD = ["git", "config", "--global", "--list", "-z"]
+
 
 class GitConfigMode:
     """Git configuration modes."""
@@ -25,32 +37,87 @@ class GitConfigMode:
     VALID_MODES = [USER_INHERIT, USER_NO_SIGN, BOT_IDENTITY]
 
 
+@functools.cache
+def _load_global_config() -> dict[str, str]:
+    """Load the entire global git config in one subprocess call.
+
+    Reading everything at once with ``--list -z`` avoids spawning one
+    git subprocess per key; the NUL-separated output is also safe for
+    values containing newlines. The result is cached for the lifetime
+    of the process since the global config does not change during a
+    tool run; ``functools.cache`` is safe under concurrent callers
+    (tests reset via ``_load_global_config.cache_clear()``).
+
+    Returns:
+        Mapping of config keys to values (empty on error)
+    """
+    try:
+        result = subprocess.run(
+            _GIT_CONFIG_LIST_CMD,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            return {}
+        return dict(
+            entry.split("\n", 1)
+            for entry in result.stdout.split("\0")
+            if "\n" in entry
+        )
+    except Exception as e:
+        logger.debug(f"Could not list global git config: {e}")
+        return {}
+
+
 def _get_global_git_config(key: str) -> str | None:
     """Get a value from global git config.
 
     Args:
         key: Git config key (e.g., "user.name")
 
+    Returns:
+        Config value or None if not set
+    """
+    value = _load_global_config().get(key)
+    return value if value else None
+
+
+def _get_repo_git_config(
+    repo_dir: str | os.PathLike[str], key: str
+) -> str | None:
+    """Get a value from the repository git config.
+
+    Uses ``--null`` so the value is NUL-terminated rather than
+    newline-terminated, avoiding a per-value strip and tolerating
+    values that contain newlines.
+
+    Args:
+        repo_dir: Repository directory path
+        key: Git config key
+
     Returns:
         Config value or None if not set
     """
     try:
         result = subprocess.run(
-            ["git", "config", "--global", key],
+            ["git", "config", "--null", key],
+            cwd=repo_dir,
             capture_output=True,
             text=True,
             check=False,
         )
-        if result.returncode == 0:
-            value = result.stdout.strip()
-            return value if value else None
-        return None
+        if result.returncode != 0:
+            return None
+        return result.stdout.split("\0", 1)[0] or None
     except Exception as e:
         logger.debug(f"Could not get git config {key}: {e}")
         return None
 
 
-def _set_repo_git_config(repo_dir: Path, key: str, value: str) -> bool:
+def _set_repo_git_config(
+    repo_dir: str | os.PathLike[str], key: str, value: str
+) -> bool:
     """Set a git config value in the repository.
 
     Args:
@@ -74,6 +141,97 @@ def _set_repo_git_config(repo_dir: Path, key: str, value: str) -> bool:
         return False
 
 
+def _config_section(key: str) -> tuple[str, str]:
+    """Split a dotted git config key into (section header, option).
+
+    Args:
+        key: Git config key (e.g., "gpg.ssh.allowedSignersFile")
+
+    Returns:
+        Tuple of config-file section name and option name
+    """
+    section, _, option = key.rpartition(".")
+    if "." in section:
+        main, _, sub = section.partition(".")
+        section = f'{main} "{sub}"'
+    return section, option
+
+
+def _set_repo_git_config_bulk(
+    repo_dir: str | os.PathLike[str], entries: dict[str, str]
+) -> bool:
+    """Set multiple git config values in the repository in one pass.
+
+    Rewrites ``<repo>/.git/config`` directly instead of spawning one
+    ``git config`` subprocess per key, cutting N fork/exec roundtrips
+    to a single file rewrite. Configs that the rewrite cannot represent
+    faithfully -- comments would be dropped, and the duplicate keys git
+    uses for multi-valued options (e.g. several ``remote.origin.fetch``
+    refspecs) are rejected by the parser -- fall back to one ``git
+    config`` subprocess per key.
+
+    Args:
+        repo_dir: Repository directory path
+        entries: Mapping of git config keys to values
+
+    Returns:
+        True if all entries were applied, False otherwise
+    """
+    config_path = Path(repo_dir) / ".git" / "config"
+    try:
+        text = (
+            config_path.read_text(encoding="utf-8")
+            if config_path.exists()
+            else ""
+        )
+        if any(
+            line.lstrip().startswith(("#", ";")) for line in text.splitlines()
+        ):
+            msg = "config contains comments"
+            raise ValueError(msg)
+        parser = configparser.ConfigParser()
+        # Git config keys are case-insensitive but conventionally
+        # camelCase; preserve whatever casing the caller used.
+        parser.optionxform = str  # type: ignore[method-assign, assignment]
+        # Strict parsing raises on the duplicate options of
+        # multi-valued keys instead of silently collapsing them
+        parser.read_string(text)
+        for key, value in entries.items():
+            section, option = _config_section(key)
+            if not parser.has_section(section):
+                parser.add_section(section)
+            parser.set(section, option, value)
+        with config_path.open("w", encoding="utf-8") as f:
+            parser.write(f)
+        return True
+    except Exception as e:
+        logger.debug(f"Falling back to per-key git config: {e}")
+
+    # Per-key fallback: git itself handles comments and multi-valued
+    # keys correctly. Attempt every entry so one failure does not skip
+    # the rest.
+    results = [
+        _set_repo_git_config(repo_dir, key, value)
+        for key, value in entries.items()
+    ]
+    return all(results)
+
+
+def _apply_repo_config(repo_dir: Path, entries: dict[str, str]) -> None:
+    """Apply config entries to the repository or raise.
+
+    Args:
+        repo_dir: Repository directory path
+        entries: Mapping of git config keys to values
+
+    Raises:
+        GitOperationError: If any entry could not be applied
+    """
+    if not _set_repo_git_config_bulk(repo_dir, entries):
+        msg = f"Could not apply git config entries: {', '.join(entries)}"
+        raise GitOperationError(msg)
+
+
 def configure_git_identity(
     repo_dir: Path,
     mode: str = GitConfigMode.USER_INHERIT,
@@ -94,22 +252,18 @@ def configure_git_identity(
 
     Raises:
         ValueError: If mode is invalid
+        GitOperationError: If the configuration could not be applied
     """
     if mode not in GitConfigMode.VALID_MODES:
         msg = f"Invalid mode: {mode}"
         raise ValueError(msg)
 
-    applied_config: dict[str, str] = {}
-
     if mode == GitConfigMode.BOT_IDENTITY:
         # Use bot identity without signing
         logger.debug("Configuring git with bot identity (no signing)")
-        _set_repo_git_config(repo_dir, "user.name", bot_name)
-        _set_repo_git_config(repo_dir, "user.email", bot_email)
-        applied_config["user.name"] = bot_name
-        applied_config["user.email"] = bot_email
-        applied_config["mode"] = "bot_identity"
-        return applied_config
+        entries = {"user.name": bot_name, "user.email": bot_email}
+        _apply_repo_config(repo_dir, entries)
+        return {**entries, "mode": "bot_identity"}
 
     # For USER_INHERIT and USER_NO_SIGN modes, try to get user's config
     user_name = _get_global_git_config("user.name")
@@ -119,26 +273,19 @@ def configure_git_identity(
         logger.warning(
             "User git config not found, falling back to bot identity"
         )
-        _set_repo_git_config(repo_dir, "user.name", bot_name)
-        _set_repo_git_config(repo_dir, "user.email", bot_email)
-        applied_config["user.name"] = bot_name
-        applied_config["user.email"] = bot_email
-        applied_config["mode"] = "bot_identity_fallback"
-        return applied_config
-
-    # Set user identity
-    _set_repo_git_config(repo_dir, "user.name", user_name)
-    _set_repo_git_config(repo_dir, "user.email", user_email)
-    applied_config["user.name"] = user_name
-    applied_config["user.email"] = user_email
+        entries = {"user.name": bot_name, "user.email": bot_email}
+        _apply_repo_config(repo_dir, entries)
+        return {**entries, "mode": "bot_identity_fallback"}
+
+    # Collect all desired entries first, then write them in one pass
+    entries = {"user.name": user_name, "user.email": user_email}
 
     if mode == GitConfigMode.USER_NO_SIGN:
         # Explicitly disable signing
         logger.debug("Configuring git with user identity (signing disabled)")
-        _set_repo_git_config(repo_dir, "commit.gpgsign", "false")
-        applied_config["commit.gpgsign"] = "false"
-        applied_config["mode"] = "user_no_sign"
-        return applied_config
+        entries["commit.gpgsign"] = "false"
+        _apply_repo_config(repo_dir, entries)
+        return {**entries, "mode": "user_no_sign"}
 
     # USER_INHERIT mode: copy signing configuration
     logger.debug("Configuring git with user identity (inheriting signing)")
@@ -146,65 +293,42 @@ def configure_git_identity(
     # Check if user has signing enabled
     gpgsign = _get_global_git_config("commit.gpgsign")
     if gpgsign == "true":
-        _set_repo_git_config(repo_dir, "commit.gpgsign", "true")
-        applied_config["commit.gpgsign"] = "true"
+        entries["commit.gpgsign"] = "true"
 
         # Get GPG format (ssh, openpgp, x509)
         # If not set, Git defaults to openpgp
         gpg_format = _get_global_git_config("gpg.format")
         if gpg_format:
-            _set_repo_git_config(repo_dir, "gpg.format", gpg_format)
-            applied_config["gpg.format"] = gpg_format
+            entries["gpg.format"] = gpg_format
 
         # Handle SSH-specific configuration
         if gpg_format == "ssh":
-            # Copy SSH signing key
-            ssh_key = _get_global_git_config("user.signingkey")
-            if ssh_key:
-                _set_repo_git_config(repo_dir, "user.signingkey", ssh_key)
-                applied_config["user.signingkey"] = ssh_key
-
-            # Copy allowed signers file
-            allowed_signers = _get_global_git_config(
-                "gpg.ssh.allowedSignersFile"
+            ssh_keys = (
+                "user.signingkey",
+                "gpg.ssh.allowedSignersFile",
+                "gpg.ssh.defaultKeyCommand",
             )
-            if allowed_signers:
-                _set_repo_git_config(
-                    repo_dir, "gpg.ssh.allowedSignersFile", allowed_signers
-                )
-                applied_config["gpg.ssh.allowedSignersFile"] = allowed_signers
-
-            # Copy default key ID if set
-            default_key = _get_global_git_config("gpg.ssh.defaultKeyCommand")
-            if default_key:
-                _set_repo_git_config(
-                    repo_dir, "gpg.ssh.defaultKeyCommand", default_key
-                )
-                applied_config["gpg.ssh.defaultKeyCommand"] = default_key
+            for key in ssh_keys:
+                value = _get_global_git_config(key)
+                if value:
+                    entries[key] = value
 
         # Handle GPG-specific configuration (openpgp, x509, or default)
         elif gpg_format in ["openpgp", "x509"] or not gpg_format:
-            # Copy GPG signing key
-            signing_key = _get_global_git_config("user.signingkey")
-            if signing_key:
-                _set_repo_git_config(repo_dir, "user.signingkey", signing_key)
-                applied_config["user.signingkey"] = signing_key
-
-            # Copy GPG program if specified
-            gpg_program = _get_global_git_config("gpg.program")
-            if gpg_program:
-                _set_repo_git_config(repo_dir, "gpg.program", gpg_program)
-                applied_config["gpg.program"] = gpg_program
+            for key in ("user.signingkey", "gpg.program"):
+                value = _get_global_git_config(key)
+                if value:
+                    entries[key] = value
 
         logger.debug(
             f"Git signing enabled: format={gpg_format or 'openpgp'}, "
-            f"key={'configured' if applied_config.get('user.signingkey') else 'default'}"
+            f"key={'configured' if entries.get('user.signingkey') else 'default'}"
         )
     else:
         logger.debug("User does not have commit signing enabled")
 
-    applied_config["mode"] = "user_inherit"
-    return applied_config
+    _apply_repo_config(repo_dir, entries)
+    return {**entries, "mode": "user_inherit"}
 
 
 def get_signing_info(repo_dir: Path) -> dict[str, str | bool]:
@@ -219,36 +343,16 @@ def get_signing_info(repo_dir: Path) -> dict[str, str | bool]:
     info: dict[str, str | bool] = {}
 
     try:
-        result = subprocess.run(
-            ["git", "config", "commit.gpgsign"],
-            cwd=repo_dir,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        info["signing_enabled"] = result.stdout.strip() == "true"
+        gpgsign = _get_repo_git_config(repo_dir, "commit.gpgsign")
+        info["signing_enabled"] = gpgsign == "true"
 
         if info["signing_enabled"]:
-            # Get format
-            result = subprocess.run(
-                ["git", "config", "gpg.format"],
-                cwd=repo_dir,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            gpg_format = result.stdout.strip()
+            # Get format; Git defaults to openpgp when unset
+            gpg_format = _get_repo_git_config(repo_dir, "gpg.format")
             info["format"] = gpg_format if gpg_format else "openpgp"
 
             # Get signing key
-            result = subprocess.run(
-                ["git", "config", "user.signingkey"],
-                cwd=repo_dir,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            signing_key = result.stdout.strip()
+            signing_key = _get_repo_git_config(repo_dir, "user.signingkey")
             if signing_key:
                 info["signing_key"] = signing_key
 
@@ -6,28 +6,93 @@
 from __future__ import annotations
 
 import base64
+import functools
+import time
 from typing import Any
 
 import httpx
+import orjson
 from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
     retry,
     retry_if_not_exception_type,
     stop_after_attempt,
+    wait_combine,
     wait_exponential,
 )
+from tenacity.wait import wait_base
 
 from .exceptions import FileAccessError, ResourceNotFoundError
 
+# Page sizes at or above this use the streaming response path, since
+# 50+ PR nodes per page can push responses into the multi-MB range
+_STREAMING_PAGE_THRESHOLD = 50
+
+
+@functools.lru_cache(maxsize=64)
+def _graphql_body_prefix(query: str) -> bytes:
+    """Serialize the static part of a GraphQL POST body.
+
+    The query templates are multi-kilobyte constants reused across
+    thousands of paginated requests; caching their serialized form
+    means each request only encodes the (small) variables payload.
+
+    Args:
+        query: GraphQL query string
+
+    Returns:
+        Opening bytes of the JSON request body, up to the query value
+    """
+    return b'{"query":' + orjson.dumps(query)
+
+
+class _wait_rate_limit(wait_base):  # noqa: N801
+    """Extra wait derived from GitHub rate-limit headers.
+
+    When a 403/429 response carries X-RateLimit-Reset, sleeping until
+    that timestamp beats exponential guessing.
+    """
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        """Return seconds to wait on top of the base strategy.
+
+        Args:
+            retry_state: Current tenacity retry state
+
+        Returns:
+            Seconds until the rate-limit reset (0 if no header)
+        """
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        response = getattr(getattr(exc, "__cause__", None), "response", None)
+        if response is not None and response.status_code in (403, 429):
+            reset = response.headers.get("X-RateLimit-Reset")
+            if reset:
+                try:
+                    return max(0.0, float(reset) - time.time())
+                except ValueError:
+                    pass
+        return 0.0
+
 
 class GitHubClient:
     """Client for GitHub API operations."""
 
-    def __init__(self, token: str, base_url: str = "https://api.github.com"):
+    def __init__(
+        self,
+        token: str,
+        base_url: str = "https://api.github.com",
+        http_client: httpx.AsyncClient | None = None,
+    ):
         """Initialize GitHub client.
 
         Args:
             token: GitHub personal access token
             base_url: GitHub API base URL
+            http_client: Pre-configured AsyncClient to use as the
+                transport (e.g. with a custom connector, proxy, or a
+                mock transport in tests); the GitHubClient takes
+                ownership and closes it on exit
         """
         self.token = token
         self.base_url = base_url
@@ -36,6 +101,29 @@ class GitHubClient:
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28",
         }
+        # One pooled client for all requests: reusing keep-alive
+        # connections avoids a TCP+TLS handshake per API call, and
+        # HTTP/2 multiplexes concurrent scan requests over a single
+        # connection instead of serializing them per socket.
+        self._http = http_client or httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+            ),
+        )
+        # One reusable retry policy for GraphQL calls rather than
+        # rebuilding tenacity's state machine per invocation; the wait
+        # strategy also honors GitHub rate-limit reset headers.
+        self._retrying = AsyncRetrying(
+            stop=stop_after_attempt(3),
+            wait=wait_combine(
+                wait_exponential(multiplier=1, min=2, max=10),
+                _wait_rate_limit(),
+            ),
+            retry=retry_if_not_exception_type(ResourceNotFoundError),
+        )
 
     async def __aenter__(self) -> GitHubClient:
         """Async context manager entry."""
@@ -43,7 +131,11 @@ class GitHubClient:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore[no-untyped-def]
         """Async context manager exit."""
-        pass
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._http.aclose()
 
     async def validate_token(self) -> tuple[bool, str, list[str]]:
         """Validate GitHub token and check permissions.
@@ -72,15 +164,14 @@ class GitHubClient:
             scopes: list[str] = []
             try:
                 url = f"{self.base_url}/user"
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.get(url, headers=self.headers)
-                    response.raise_for_status()
-
-                    # Scopes are in the X-OAuth-Scopes header
-                    scopes_header = response.headers.get("X-OAuth-Scopes", "")
-                    scopes = [
-                        s.strip() for s in scopes_header.split(",") if s.strip()
-                    ]
+                response = await self._http.get(url, headers=self.headers)
+                response.raise_for_status()
+
+                # Scopes are in the X-OAuth-Scopes header
+                scopes_header = response.headers.get("X-OAuth-Scopes", "")
+                scopes = [
+                    s.strip() for s in scopes_header.split(",") if s.strip()
+                ]
             except httpx.HTTPStatusError as scope_error:
                 # GitHub Actions tokens may not have user access (403)
                 # This is expected and we can continue without scope info
@@ -119,39 +210,35 @@ class GitHubClient:
         """
         url = f"{self.base_url}{endpoint}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.request(
-                    method,
-                    url,
-                    headers=self.headers,
-                    **kwargs,
-                )
-                response.raise_for_status()
-                result: dict[str, Any] | list[dict[str, Any]] = response.json()
-                return result
-            except httpx.HTTPStatusError as e:
-                # Don't retry 404 errors - they won't succeed on retry
-                if e.response.status_code == 404:
-                    msg = f"Resource not found: {e.response.text}"
-                    raise ResourceNotFoundError(msg) from e
-                msg = f"GitHub API error: {e.response.status_code} - {e.response.text}"
-                raise FileAccessError(msg) from e
-            except httpx.RequestError as e:
-                msg = f"Request failed: {e}"
-                raise FileAccessError(msg) from e
+        try:
+            response = await self._http.request(
+                method,
+                url,
+                headers=self.headers,
+                **kwargs,
+            )
+            response.raise_for_status()
+            result: dict[str, Any] | list[dict[str, Any]] = response.json()
+            return result
+        except httpx.HTTPStatusError as e:
+            # Don't retry 404 errors - they won't succeed on retry
+            if e.response.status_code == 404:
+                msg = f"Resource not found: {e.response.text}"
+                raise ResourceNotFoundError(msg) from e
+            msg = f"GitHub API error: {e.response.status_code} - {e.response.text}"
+            raise FileAccessError(msg) from e
+        except httpx.RequestError as e:
+            msg = f"Request failed: {e}"
+            raise FileAccessError(msg) from e
 
-    @retry(  # type: ignore[untyped-decorator]
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_not_exception_type(ResourceNotFoundError),
-    )
     async def _graphql_request(
         self,
         query: str,
         variables: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Make a GraphQL API request with retry logic.
+        """Make a single GraphQL API request.
+
+        Retries are handled by the shared policy in graphql().
 
         Args:
             query: GraphQL query string
@@ -164,44 +251,73 @@ class GitHubClient:
             FileAccessError: If request fails
         """
         url = "https://api.github.com/graphql"
-        payload: dict[str, Any] = {"query": query}
+        body = _graphql_body_prefix(query)
         if variables:
-            payload["variables"] = variables
+            body += b',"variables":' + orjson.dumps(variables)
+        body += b"}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.post(
-                    url,
-                    headers=self.headers,
-                    json=payload,
+        headers = {**self.headers, "Content-Type": "application/json"}
+
+        try:
+            if (variables or {}).get(
+                "prsPageSize", 0
+            ) >= _STREAMING_PAGE_THRESHOLD:
+                # Large paginated responses: consume the body in chunks
+                # as it arrives rather than waiting for httpx to buffer
+                # the complete response before handing it over
+                async with self._http.stream(
+                    "POST", url, headers=headers, content=body
+                ) as stream_response:
+                    if stream_response.is_success:
+                        content = b"".join(
+                            [
+                                chunk
+                                async for chunk in (
+                                    stream_response.aiter_bytes()
+                                )
+                            ]
+                        )
+                    else:
+                        # Buffer the error body so the handler below
+                        # can include it in the message
+                        await stream_response.aread()
+                        stream_response.raise_for_status()
+                        content = b""
+            else:
+                response = await self._http.post(
+                    url, headers=headers, content=body
                 )
                 response.raise_for_status()
-                json_response: Any = response.json()
-                result: dict[str, Any] = (
-                    json_response if isinstance(json_response, dict) else {}
-                )
+                content = response.content
+
+            # GraphQL payloads are large and deeply nested; orjson
+            # decodes them several times faster than stdlib json
+            json_response: Any = orjson.loads(content)
+            result: dict[str, Any] = (
+                json_response if isinstance(json_response, dict) else {}
+            )
 
-                # Check for GraphQL errors
-                if "errors" in result:
-                    errors = result["errors"]
-                    msg = f"GraphQL errors: {errors}"
-                    raise FileAccessError(msg)
-
-                data: dict[str, Any] = result.get("data", {})
-                return data
-            except httpx.HTTPStatusError as e:
-                msg = f"GitHub API error: {e.response.status_code} - {e.response.text}"
-                raise FileAccessError(msg) from e
-            except httpx.RequestError as e:
-                msg = f"Request failed: {e}"
-                raise FileAccessError(msg) from e
+            # Check for GraphQL errors
+            if "errors" in result:
+                errors = result["errors"]
+                msg = f"GraphQL errors: {errors}"
+                raise FileAccessError(msg)
+
+            data: dict[str, Any] = result.get("data", {})
+            return data
+        except httpx.HTTPStatusError as e:
+            msg = f"GitHub API error: {e.response.status_code} - {e.response.text}"
+            raise FileAccessError(msg) from e
+        except httpx.RequestError as e:
+            msg = f"Request failed: {e}"
+            raise FileAccessError(msg) from e
 
     async def graphql(
         self,
         query: str,
         variables: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Execute a GraphQL query.
+        """Execute a GraphQL query with retry logic.
 
         Args:
             query: GraphQL query string
@@ -211,9 +327,14 @@ class GitHubClient:
             Response data
 
         Raises:
-            FileAccessError: If request fails
+            RetryError: If the request keeps failing after retries
         """
-        result: dict[str, Any] = await self._graphql_request(query, variables)
+        # The call form keeps retry state local to this invocation;
+        # iterating the shared instance with `async for` would race
+        # concurrent graphql() calls on its stored retry state.
+        result: dict[str, Any] = await self._retrying(
+            self._graphql_request, query, variables
+        )
         return result
 
     async def get_pr_files(
@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025 The Linux Foundation
+
+"""In-process LRU cache for GraphQL responses.
+
+Many scanner queries are idempotent within a single run (repository
+counts, repeated PR-detail fetches), so caching responses keyed by the
+query text and variables turns revisits into memory lookups instead of
+network round-trips.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .github_client import GitHubClient
+
+DEFAULT_CACHE_CAPACITY = 1024
+
+
+class GraphQLCache:
+    """LRU cache for GraphQL responses keyed by (query, variables)."""
+
+    def __init__(self, capacity: int = DEFAULT_CACHE_CAPACITY):
+        """Initialize the cache.
+
+        Args:
+            capacity: Maximum number of cached responses; the least
+                recently used entry is evicted beyond this
+        """
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+
+    @staticmethod
+    def _key(query: str, variables: dict[str, Any] | None) -> bytes:
+        """Build a compact digest key for a query and its variables.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+
+        Returns:
+            16-byte blake2b digest identifying the request
+        """
+        payload = (
+            query.encode()
+            + json.dumps(
+                variables or {}, sort_keys=True, separators=(",", ":")
+            ).encode()
+        )
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    async def get_or_fetch(
+        self,
+        client: GitHubClient,
+        query: str,
+        variables: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Return a cached response or execute the query and cache it.
+
+        Args:
+            client: GitHub API client used on cache misses
+            query: GraphQL query string
+            variables: Query variables
+
+        Returns:
+            Response data (cached or freshly fetched)
+        """
+        key = self._key(query, variables)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        result = await client.graphql(query, variables=variables)
+        self._entries[key] = result
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
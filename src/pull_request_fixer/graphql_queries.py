@@ -3,9 +3,11 @@
 
 """GraphQL queries for efficient organization scanning."""
 
+import sys
+
 # Lightweight query to list repositories without PR nodes for accurate counting
 # This is the SAME query used by dependamerge for efficient repo enumeration
-ORG_REPOS_ONLY = """
+ORG_REPOS_ONLY = sys.intern("""
 query($org: String!, $reposCursor: String) {
   organization(login: $org) {
     repositories(first: 100, after: $reposCursor, orderBy: { field: NAME, direction: ASC }) {
@@ -21,12 +23,12 @@ query($org: String!, $reposCursor: String) {
     }
   }
 }
-"""
+""")
 
 
 # Query to get repositories WITH open PRs in an organization (aggregated)
 # NOTE: This should NOT be used for counting - use ORG_REPOS_ONLY instead
-ORG_REPOS_WITH_PRS = """
+ORG_REPOS_WITH_PRS = sys.intern("""
 query($org: String!, $cursor: String, $prsPageSize: Int!, $contextsPageSize: Int!) {
   organization(login: $org) {
     repositories(first: 30, after: $cursor, orderBy: { field: NAME, direction: ASC }) {
@@ -105,12 +107,12 @@ query($org: String!, $cursor: String, $prsPageSize: Int!, $contextsPageSize: Int
     }
   }
 }
-"""
+""")
 
 
 # Query to get open PRs for a specific repository with status checks
 # This matches dependamerge's REPO_OPEN_PRS_PAGE with parameterized page sizes
-REPO_OPEN_PRS_PAGE = """
+REPO_OPEN_PRS_PAGE = sys.intern("""
 query($owner: String!, $name: String!, $prsCursor: String, $prsPageSize: Int!, $filesPageSize: Int!, $commentsPageSize: Int!, $contextsPageSize: Int!) {
   repository(owner: $owner, name: $name) {
     nameWithOwner
@@ -200,10 +202,82 @@ query($owner: String!, $name: String!, $prsCursor: String, $prsPageSize: Int!, $
     }
   }
 }
-"""
+""")
+
+# Trimmed variant of REPO_OPEN_PRS_PAGE used by the scanner hot path.
+# The scanner only reads identity/draft/merge-state fields and the
+# status-check rollup; omitting files, comments and reviews cuts
+# response bytes and resolver cost per page.
+REPO_OPEN_PRS_PAGE_MINIMAL = sys.intern("""
+query($owner: String!, $name: String!, $prsCursor: String, $prsPageSize: Int!, $contextsPageSize: Int!) {
+  repository(owner: $owner, name: $name) {
+    nameWithOwner
+    pullRequests(
+      states: OPEN
+      first: $prsPageSize
+      after: $prsCursor
+      orderBy: { field: CREATED_AT, direction: DESC }
+    ) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        number
+        title
+        body
+        url
+        isDraft
+        author { login }
+        mergeable
+        mergeStateStatus
+        baseRefName
+        headRefName
+        headRefOid
+        createdAt
+        updatedAt
+        headRepository {
+          nameWithOwner
+          url
+        }
+        baseRepository {
+          nameWithOwner
+          url
+        }
+        isCrossRepository
+        maintainerCanModify
+        commits(last: 1) {
+          nodes {
+            commit {
+              oid
+              statusCheckRollup {
+                state
+                contexts(first: $contextsPageSize) {
+                  nodes {
+                    __typename
+                    ... on CheckRun {
+                      name
+                      status
+                      conclusion
+                    }
+                    ... on StatusContext {
+                      context
+                      state
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+""")
 
 # Query to get a single PR with status checks
-PR_WITH_STATUS = """
+PR_WITH_STATUS = sys.intern("""
 query($owner: String!, $name: String!, $number: Int!, $contextsPageSize: Int!) {
   repository(owner: $owner, name: $name) {
     pullRequest(number: $number) {
@@ -257,10 +331,10 @@ query($owner: String!, $name: String!, $number: Int!, $contextsPageSize: Int!) {
     }
   }
 }
-"""
+""")
 
 # Query to get first commit message for a PR (lightweight)
-PR_FIRST_COMMIT = """
+PR_FIRST_COMMIT = sys.intern("""
 query($owner: String!, $name: String!, $number: Int!) {
   repository(owner: $owner, name: $name) {
     pullRequest(number: $number) {
@@ -279,32 +353,42 @@ query($owner: String!, $name: String!, $number: Int!) {
     }
   }
 }
-"""
+""")
+
+# Shared selection set for the bulk query below: declaring the fields
+# once as a named fragment keeps each PR alias to a single spread
+# instead of duplicating the field list per aliased pullRequest
+PR_COMMIT_FIELDS_FRAGMENT = sys.intern("""
+fragment PRCommitFields on PullRequest {
+  number
+  title
+  commits(first: 1) {
+    nodes {
+      commit {
+        oid
+        message
+        messageHeadline
+        messageBody
+      }
+    }
+  }
+}
+""")
 
 # Bulk query to get first commit messages for multiple PRs (performance optimized)
 # This uses GraphQL aliases to fetch multiple PRs in a single request
-BULK_PR_COMMITS_TEMPLATE = """
+BULK_PR_COMMITS_TEMPLATE = sys.intern(
+    """
 query($owner: String!, $name: String!) {
   repository(owner: $owner, name: $name) {
     {pr_queries}
   }
 }
 """
+    + PR_COMMIT_FIELDS_FRAGMENT
+)
 
-# Template for individual PR in bulk query
-PR_COMMIT_FRAGMENT = """
-    pr{number}: pullRequest(number: {number}) {
-      number
-      title
-      commits(first: 1) {
-        nodes {
-          commit {
-            oid
-            message
-            messageHeadline
-            messageBody
-          }
-        }
-      }
-    }
-"""
+# Template for an individual PR alias in the bulk query
+PR_COMMIT_FRAGMENT = sys.intern("""
+    pr{number}: pullRequest(number: {number}) { ...PRCommitFields }
+""")
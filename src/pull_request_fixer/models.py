@@ -21,7 +21,7 @@ class OutputFormat(str, Enum):
     TABLE = "table"
 
 
-@dataclass
+@dataclass(slots=True)
 class PRInfo:
     """Information about a GitHub pull request."""
 
@@ -38,7 +38,7 @@ class PRInfo:
     merge_state_status: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockedPR:
     """A blocked pull request with blocking reasons."""
 
@@ -47,7 +47,7 @@ class BlockedPR:
     has_title_issues: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class GitHubScanResult:
     """Results from scanning a GitHub organization."""
 
@@ -59,7 +59,7 @@ class GitHubScanResult:
     errors: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileModification:
     """Information about a file modification."""
 
@@ -89,7 +89,7 @@ class FileModification:
         return "\n".join(diff_lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class GitHubFixResult:
     """Result of fixing a PR."""
 
@@ -26,6 +26,19 @@ from .exceptions import ResourceNotFoundError
 from .git_config import GitConfigMode, configure_git_identity
 from .models import GitHubFixResult
 
+# Token-shaped secrets to redact from messages, compiled once rather
+# than per sanitization call
+_TOKEN_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"ghp_[a-zA-Z0-9]{36}",  # GitHub personal access tokens
+        r"ghs_[a-zA-Z0-9]{36}",  # GitHub server tokens
+        r"github_pat_[a-zA-Z0-9_]{82}",  # GitHub fine-grained tokens
+        r"https://[^:]+:[^@]+@",  # URLs with credentials
+        r"x-access-token:[^@]+@",  # Git auth tokens
+    )
+)
+
 
 class PRFileFixer:
     """Fixes files in pull requests using Git operations."""
@@ -54,18 +67,9 @@ class PRFileFixer:
         Returns:
             Sanitized message with tokens removed
         """
-        # Remove common token patterns
-        patterns = [
-            r"ghp_[a-zA-Z0-9]{36}",  # GitHub personal access tokens
-            r"ghs_[a-zA-Z0-9]{36}",  # GitHub server tokens
-            r"github_pat_[a-zA-Z0-9_]{82}",  # GitHub fine-grained tokens
-            r"https://[^:]+:[^@]+@",  # URLs with credentials
-            r"x-access-token:[^@]+@",  # Git auth tokens
-        ]
-
         sanitized = message
-        for pattern in patterns:
-            sanitized = re.sub(pattern, "[REDACTED]", sanitized)
+        for pattern in _TOKEN_PATTERNS:
+            sanitized = pattern.sub("[REDACTED]", sanitized)
 
         return sanitized
 
@@ -10,3 +10,44 @@ import sys
 src_path = Path(__file__).parent.parent / "src"
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture
+def configure_batch_mocks():
+    """Return a helper wiring the batch-update mocks on a client stub.
+
+    The sha-refetch tests configure the same three attributes with minor
+    differences; this keeps the wiring in one place.
+    """
+
+    def _configure(
+        client,
+        *,
+        batch_raises=None,
+        refetch_returns=None,
+        update_returns=None,
+    ):
+        if batch_raises is not None:
+            client.update_files_in_batch.side_effect = batch_raises
+        else:
+            client.update_files_in_batch.return_value = None
+        client._request.return_value = refetch_returns
+        client.update_file.return_value = update_returns
+
+    return _configure
+
+
+@pytest.fixture(autouse=True)
+def _reset_global_config_cache():
+    """Clear the cached global git config around every test.
+
+    Keeps the per-process cache from leaking mocked (or real) config
+    between tests, including across pytest-xdist workers.
+    """
+    from pull_request_fixer.git_config import _load_global_config
+
+    _load_global_config.cache_clear()
+    yield
+    _load_global_config.cache_clear()
@@ -5,33 +5,166 @@
 
 from __future__ import annotations
 
-from pathlib import Path
 import subprocess
-import tempfile
-from unittest.mock import MagicMock, patch
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 from pull_request_fixer.git_config import (
+    _GIT_CONFIG_LIST_CMD,
     GitConfigMode,
     _get_global_git_config,
     _set_repo_git_config,
+    _set_repo_git_config_bulk,
     configure_git_identity,
     get_signing_info,
 )
 
 
+@pytest.fixture(scope="module")
+def repo_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Shared repository directory with a .git dir for config writes."""
+    path = tmp_path_factory.mktemp("repo")
+    (path / ".git").mkdir()
+    return path
+
+
+def _cp(rc: int = 0, out: str = "") -> subprocess.CompletedProcess[str]:
+    """Build a real CompletedProcess result for mocked git calls.
+
+    The real class is cheaper to construct than a MagicMock and its
+    attribute access catches API drift like a spec'd mock would.
+    """
+    return subprocess.CompletedProcess(
+        args=[], returncode=rc, stdout=out, stderr=""
+    )
+
+
+# Pre-built result for git invocations whose output is ignored.
+_OK_RESULT = _cp()
+
+# Global-config contents and expected applied config for each
+# configure_git_identity mode; the fallback case uses the bot identity
+# passed by the test.
+_IDENTITY_CASES = [
+    pytest.param(
+        {"user.name": "Jane Doe", "user.email": "jane@example.com"},
+        GitConfigMode.USER_INHERIT,
+        {
+            "user.name": "Jane Doe",
+            "user.email": "jane@example.com",
+            "mode": "user_inherit",
+        },
+        id="user_inherit_no_signing",
+    ),
+    pytest.param(
+        {
+            "user.name": "Jane Doe",
+            "user.email": "jane@example.com",
+            "commit.gpgsign": "true",
+            "gpg.format": "openpgp",
+            "user.signingkey": "ABCD1234",
+            "gpg.program": "/usr/bin/gpg2",
+        },
+        GitConfigMode.USER_INHERIT,
+        {
+            "user.name": "Jane Doe",
+            "user.email": "jane@example.com",
+            "commit.gpgsign": "true",
+            "gpg.format": "openpgp",
+            "user.signingkey": "ABCD1234",
+            "gpg.program": "/usr/bin/gpg2",
+            "mode": "user_inherit",
+        },
+        id="user_inherit_gpg_signing",
+    ),
+    pytest.param(
+        {
+            "user.name": "Jane Doe",
+            "user.email": "jane@example.com",
+            "commit.gpgsign": "true",
+            "gpg.format": "ssh",
+            "user.signingkey": "~/.ssh/id_ed25519.pub",
+            "gpg.ssh.allowedSignersFile": "~/.ssh/allowed_signers",
+        },
+        GitConfigMode.USER_INHERIT,
+        {
+            "user.name": "Jane Doe",
+            "user.email": "jane@example.com",
+            "commit.gpgsign": "true",
+            "gpg.format": "ssh",
+            "user.signingkey": "~/.ssh/id_ed25519.pub",
+            "gpg.ssh.allowedSignersFile": "~/.ssh/allowed_signers",
+            "mode": "user_inherit",
+        },
+        id="user_inherit_ssh_signing",
+    ),
+    pytest.param(
+        {"user.name": "Jane Doe", "user.email": "jane@example.com"},
+        GitConfigMode.USER_NO_SIGN,
+        {
+            "user.name": "Jane Doe",
+            "user.email": "jane@example.com",
+            "commit.gpgsign": "false",
+            "mode": "user_no_sign",
+        },
+        id="user_no_sign",
+    ),
+    pytest.param(
+        {},
+        GitConfigMode.USER_INHERIT,
+        {
+            "user.name": "fallback-bot",
+            "user.email": "fallback@example.com",
+            "mode": "bot_identity_fallback",
+        },
+        id="fallback_to_bot",
+    ),
+]
+
+# Repository signing config and the info get_signing_info reports.
+_SIGNING_CASES = [
+    pytest.param(
+        {
+            "commit.gpgsign": "true",
+            "gpg.format": "ssh",
+            "user.signingkey": "~/.ssh/key.pub",
+        },
+        {
+            "signing_enabled": True,
+            "format": "ssh",
+            "signing_key": "~/.ssh/key.pub",
+        },
+        id="ssh_signing",
+    ),
+    pytest.param(
+        {"commit.gpgsign": "false"},
+        {"signing_enabled": False},
+        id="signing_disabled",
+    ),
+    pytest.param(
+        {"commit.gpgsign": "true", "gpg.format": ""},
+        {"signing_enabled": True, "format": "openpgp"},
+        id="default_format",
+    ),
+]
+
+
 class TestGetGlobalGitConfig:
     """Tests for _get_global_git_config function."""
 
     def test_get_existing_config(self) -> None:
         """Test getting an existing git config value."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0, stdout="John Doe\n")
+        with patch.object(subprocess, "run") as mock_run:
+            mock_run.return_value = _cp(out="user.name\nJohn Doe\0")
             result = _get_global_git_config("user.name")
             assert result == "John Doe"
             mock_run.assert_called_once_with(
-                ["git", "config", "--global", "user.name"],
+                _GIT_CONFIG_LIST_CMD,
                 capture_output=True,
                 text=True,
                 check=False,
@@ -39,15 +172,15 @@ class TestGetGlobalGitConfig:
 
     def test_get_nonexistent_config(self) -> None:
         """Test getting a non-existent git config value."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=1, stdout="")
+        with patch.object(subprocess, "run") as mock_run:
+            mock_run.return_value = _cp(out="user.name\nJohn Doe\0")
             result = _get_global_git_config("user.nonexistent")
             assert result is None
 
     def test_get_empty_config(self) -> None:
         """Test getting an empty git config value."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0, stdout="")
+        with patch.object(subprocess, "run") as mock_run:
+            mock_run.return_value = _cp(out="user.name\n\0")
             result = _get_global_git_config("user.name")
             assert result is None
 
@@ -55,255 +188,128 @@ class TestGetGlobalGitConfig:
 class TestSetRepoGitConfig:
     """Tests for _set_repo_git_config function."""
 
-    def test_set_config_success(self) -> None:
+    def test_set_config_success(self, repo_dir: Path) -> None:
         """Test successfully setting a git config value."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_dir = Path(tmpdir)
-            with patch("subprocess.run") as mock_run:
-                mock_run.return_value = MagicMock(returncode=0)
-                result = _set_repo_git_config(repo_dir, "user.name", "Test")
-                assert result is True
-
-    def test_set_config_failure(self) -> None:
+        with patch.object(subprocess, "run") as mock_run:
+            mock_run.return_value = _OK_RESULT
+            result = _set_repo_git_config(repo_dir, "user.name", "Test")
+            assert result is True
+
+    def test_set_config_failure(self, repo_dir: Path) -> None:
         """Test handling failure when setting git config."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_dir = Path(tmpdir)
-            with patch("subprocess.run") as mock_run:
-                mock_run.side_effect = subprocess.CalledProcessError(1, "git")
-                result = _set_repo_git_config(repo_dir, "user.name", "Test")
-                assert result is False
+        with patch.object(subprocess, "run") as mock_run:
+            mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+            result = _set_repo_git_config(repo_dir, "user.name", "Test")
+            assert result is False
+
+    def test_set_config_bulk_success(self, tmp_path: Path) -> None:
+        """Test writing multiple config entries in a single pass."""
+        (tmp_path / ".git").mkdir()
+        result = _set_repo_git_config_bulk(
+            tmp_path,
+            {
+                "user.name": "Test Bot",
+                "user.email": "bot@example.com",
+                "commit.gpgsign": "false",
+                "gpg.ssh.allowedSignersFile": "~/.ssh/allowed_signers",
+            },
+        )
+        assert result is True
+        content = (tmp_path / ".git" / "config").read_text()
+        assert "name = Test Bot" in content
+        assert "email = bot@example.com" in content
+        assert "gpgsign = false" in content
+        assert '[gpg "ssh"]' in content
+        assert "allowedSignersFile = ~/.ssh/allowed_signers" in content
 
 
 class TestConfigureGitIdentity:
     """Tests for configure_git_identity function."""
 
-    def test_bot_identity_mode(self) -> None:
+    def test_bot_identity_mode(self, repo_dir: Path) -> None:
         """Test BOT_IDENTITY mode."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_dir = Path(tmpdir)
-            with patch("subprocess.run") as mock_run:
-                mock_run.return_value = MagicMock(returncode=0)
-                config = configure_git_identity(
-                    repo_dir,
-                    mode=GitConfigMode.BOT_IDENTITY,
-                    bot_name="test-bot",
-                    bot_email="bot@example.com",
-                )
-
-                assert config["user.name"] == "test-bot"
-                assert config["user.email"] == "bot@example.com"
-                assert config["mode"] == "bot_identity"
-                assert "commit.gpgsign" not in config
-
-    def test_user_inherit_mode_no_signing(self) -> None:
-        """Test USER_INHERIT mode when user has no signing enabled."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_dir = Path(tmpdir)
-
-            def mock_git_config(cmd, **kwargs):  # noqa: ARG001
-                if cmd == ["git", "config", "--global", "user.name"]:
-                    return MagicMock(returncode=0, stdout="Jane Doe\n")
-                if cmd == ["git", "config", "--global", "user.email"]:
-                    return MagicMock(returncode=0, stdout="jane@example.com\n")
-                if cmd == ["git", "config", "--global", "commit.gpgsign"]:
-                    return MagicMock(returncode=1, stdout="")
-                return MagicMock(returncode=0)
-
-            with patch("subprocess.run", side_effect=mock_git_config):
-                config = configure_git_identity(
-                    repo_dir, mode=GitConfigMode.USER_INHERIT
-                )
-
-                assert config["user.name"] == "Jane Doe"
-                assert config["user.email"] == "jane@example.com"
-                assert config["mode"] == "user_inherit"
-                assert "commit.gpgsign" not in config
-
-    def test_user_inherit_mode_with_gpg_signing(self) -> None:
-        """Test USER_INHERIT mode with GPG signing enabled."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_dir = Path(tmpdir)
-
-            def mock_git_config(cmd, **kwargs):  # noqa: ARG001, PLR0911
-                if cmd == ["git", "config", "--global", "user.name"]:
-                    return MagicMock(returncode=0, stdout="Jane Doe\n")
-                if cmd == ["git", "config", "--global", "user.email"]:
-                    return MagicMock(returncode=0, stdout="jane@example.com\n")
-                if cmd == ["git", "config", "--global", "commit.gpgsign"]:
-                    return MagicMock(returncode=0, stdout="true\n")
-                if cmd == ["git", "config", "--global", "gpg.format"]:
-                    return MagicMock(returncode=0, stdout="openpgp\n")
-                if cmd == ["git", "config", "--global", "user.signingkey"]:
-                    return MagicMock(returncode=0, stdout="ABCD1234\n")
-                if cmd == ["git", "config", "--global", "gpg.program"]:
-                    return MagicMock(returncode=0, stdout="/usr/bin/gpg2\n")
-                return MagicMock(returncode=0)
-
-            with patch("subprocess.run", side_effect=mock_git_config):
-                config = configure_git_identity(
-                    repo_dir, mode=GitConfigMode.USER_INHERIT
-                )
-
-                assert config["user.name"] == "Jane Doe"
-                assert config["user.email"] == "jane@example.com"
-                assert config["commit.gpgsign"] == "true"
-                assert config["gpg.format"] == "openpgp"
-                assert config["user.signingkey"] == "ABCD1234"
-                assert config["gpg.program"] == "/usr/bin/gpg2"
-                assert config["mode"] == "user_inherit"
-
-    def test_user_inherit_mode_with_ssh_signing(self) -> None:
-        """Test USER_INHERIT mode with SSH signing enabled."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_dir = Path(tmpdir)
-
-            def mock_git_config(cmd, **kwargs):  # noqa: ARG001, PLR0911
-                if cmd == ["git", "config", "--global", "user.name"]:
-                    return MagicMock(returncode=0, stdout="Jane Doe\n")
-                if cmd == ["git", "config", "--global", "user.email"]:
-                    return MagicMock(returncode=0, stdout="jane@example.com\n")
-                if cmd == ["git", "config", "--global", "commit.gpgsign"]:
-                    return MagicMock(returncode=0, stdout="true\n")
-                if cmd == ["git", "config", "--global", "gpg.format"]:
-                    return MagicMock(returncode=0, stdout="ssh\n")
-                if cmd == ["git", "config", "--global", "user.signingkey"]:
-                    return MagicMock(
-                        returncode=0, stdout="~/.ssh/id_ed25519.pub\n"
-                    )
-                if cmd == [
-                    "git",
-                    "config",
-                    "--global",
-                    "gpg.ssh.allowedSignersFile",
-                ]:
-                    return MagicMock(
-                        returncode=0, stdout="~/.ssh/allowed_signers\n"
-                    )
-                return MagicMock(returncode=0)
-
-            with patch("subprocess.run", side_effect=mock_git_config):
-                config = configure_git_identity(
-                    repo_dir, mode=GitConfigMode.USER_INHERIT
-                )
-
-                assert config["user.name"] == "Jane Doe"
-                assert config["user.email"] == "jane@example.com"
-                assert config["commit.gpgsign"] == "true"
-                assert config["gpg.format"] == "ssh"
-                assert config["user.signingkey"] == "~/.ssh/id_ed25519.pub"
-                assert (
-                    config["gpg.ssh.allowedSignersFile"]
-                    == "~/.ssh/allowed_signers"
-                )
-                assert config["mode"] == "user_inherit"
-
-    def test_user_no_sign_mode(self) -> None:
-        """Test USER_NO_SIGN mode."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_dir = Path(tmpdir)
-
-            def mock_git_config(cmd, **kwargs):  # noqa: ARG001
-                if cmd == ["git", "config", "--global", "user.name"]:
-                    return MagicMock(returncode=0, stdout="Jane Doe\n")
-                if cmd == ["git", "config", "--global", "user.email"]:
-                    return MagicMock(returncode=0, stdout="jane@example.com\n")
-                return MagicMock(returncode=0)
-
-            with patch("subprocess.run", side_effect=mock_git_config):
-                config = configure_git_identity(
-                    repo_dir, mode=GitConfigMode.USER_NO_SIGN
-                )
-
-                assert config["user.name"] == "Jane Doe"
-                assert config["user.email"] == "jane@example.com"
-                assert config["commit.gpgsign"] == "false"
-                assert config["mode"] == "user_no_sign"
-
-    def test_user_mode_fallback_to_bot(self) -> None:
-        """Test fallback to bot identity when user config not found."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_dir = Path(tmpdir)
-
-            def mock_git_config(cmd, **kwargs):  # noqa: ARG001
-                if "user.name" in cmd or "user.email" in cmd:
-                    return MagicMock(returncode=1, stdout="")
-                return MagicMock(returncode=0)
-
-            with patch("subprocess.run", side_effect=mock_git_config):
-                config = configure_git_identity(
-                    repo_dir,
-                    mode=GitConfigMode.USER_INHERIT,
-                    bot_name="fallback-bot",
-                    bot_email="fallback@example.com",
-                )
-
-                assert config["user.name"] == "fallback-bot"
-                assert config["user.email"] == "fallback@example.com"
-                assert config["mode"] == "bot_identity_fallback"
-
-    def test_invalid_mode(self) -> None:
+        with patch.object(subprocess, "run") as mock_run:
+            mock_run.return_value = _OK_RESULT
+            config = configure_git_identity(
+                repo_dir,
+                mode=GitConfigMode.BOT_IDENTITY,
+                bot_name="test-bot",
+                bot_email="bot@example.com",
+            )
+
+            assert config["user.name"] == "test-bot"
+            assert config["user.email"] == "bot@example.com"
+            assert config["mode"] == "bot_identity"
+            assert "commit.gpgsign" not in config
+
+    @pytest.mark.parametrize(
+        ("global_cfg", "mode", "expected"), _IDENTITY_CASES
+    )
+    def test_identity_modes(
+        self,
+        tmp_path: Path,
+        global_cfg: dict[str, str],
+        mode: str,
+        expected: dict[str, str],
+    ) -> None:
+        """Test applied config for each identity/signing combination.
+
+        Uses a fresh repo per case so the assertions on the written
+        .git/config file reflect exactly the entries this mode applies.
+        """
+        (tmp_path / ".git").mkdir()
+        listing = "".join(f"{k}\n{v}\0" for k, v in global_cfg.items())
+        list_result = _cp(out=listing)
+
+        def mock_git_config(cmd, **kwargs):  # noqa: ARG001
+            if cmd == _GIT_CONFIG_LIST_CMD:
+                return list_result
+            return _OK_RESULT
+
+        with patch.object(subprocess, "run", side_effect=mock_git_config):
+            config = configure_git_identity(
+                tmp_path,
+                mode=mode,
+                bot_name="fallback-bot",
+                bot_email="fallback@example.com",
+            )
+
+        assert config == expected
+
+        # The entries must actually land in the repo config file, not
+        # just in the reported dict
+        written = (tmp_path / ".git" / "config").read_text()
+        for key, value in expected.items():
+            if key == "mode":
+                continue
+            option = key.rpartition(".")[2]
+            assert f"{option} = {value}" in written
+
+    def test_invalid_mode(self, repo_dir: Path) -> None:
         """Test that invalid mode raises ValueError."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_dir = Path(tmpdir)
-            with pytest.raises(ValueError, match="Invalid mode"):
-                configure_git_identity(repo_dir, mode="invalid_mode")
+        with pytest.raises(ValueError, match="Invalid mode"):
+            configure_git_identity(repo_dir, mode="invalid_mode")
 
 
 class TestGetSigningInfo:
     """Tests for get_signing_info function."""
 
-    def test_signing_enabled_with_ssh(self) -> None:
-        """Test getting signing info when SSH signing is enabled."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_dir = Path(tmpdir)
-
-            def mock_git_config(cmd, **kwargs):  # noqa: ARG001
-                if "commit.gpgsign" in cmd:
-                    return MagicMock(returncode=0, stdout="true\n")
-                if "gpg.format" in cmd:
-                    return MagicMock(returncode=0, stdout="ssh\n")
-                if "user.signingkey" in cmd:
-                    return MagicMock(returncode=0, stdout="~/.ssh/key.pub\n")
-                return MagicMock(returncode=0)
-
-            with patch("subprocess.run", side_effect=mock_git_config):
-                info = get_signing_info(repo_dir)
-
-                assert info["signing_enabled"] is True
-                assert info["format"] == "ssh"
-                assert info["signing_key"] == "~/.ssh/key.pub"
-
-    def test_signing_disabled(self) -> None:
-        """Test getting signing info when signing is disabled."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_dir = Path(tmpdir)
-
-            def mock_git_config(cmd, **kwargs):  # noqa: ARG001
-                if "commit.gpgsign" in cmd:
-                    return MagicMock(returncode=0, stdout="false\n")
-                return MagicMock(returncode=0)
-
-            with patch("subprocess.run", side_effect=mock_git_config):
-                info = get_signing_info(repo_dir)
-
-                assert info["signing_enabled"] is False
-                assert "format" not in info
-                assert "signing_key" not in info
-
-    def test_signing_info_with_default_format(self) -> None:
-        """Test that default format is openpgp when not specified."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_dir = Path(tmpdir)
-
-            def mock_git_config(cmd, **kwargs):  # noqa: ARG001
-                if "commit.gpgsign" in cmd:
-                    return MagicMock(returncode=0, stdout="true\n")
-                if "gpg.format" in cmd:
-                    return MagicMock(returncode=0, stdout="")
-                return MagicMock(returncode=0)
-
-            with patch("subprocess.run", side_effect=mock_git_config):
-                info = get_signing_info(repo_dir)
-
-                assert info["signing_enabled"] is True
-                assert info["format"] == "openpgp"
+    @pytest.mark.parametrize(("repo_cfg", "expected"), _SIGNING_CASES)
+    def test_get_signing_info(
+        self,
+        repo_dir: Path,
+        repo_cfg: dict[str, str],
+        expected: dict[str, str | bool],
+    ) -> None:
+        """Test reported info for each repo signing configuration."""
+        results = {
+            key: _cp(out=f"{value}\0") for key, value in repo_cfg.items()
+        }
+
+        def mock_git_config(cmd, **kwargs):  # noqa: ARG001
+            return results.get(cmd[-1], _OK_RESULT)
+
+        with patch.object(subprocess, "run", side_effect=mock_git_config):
+            info = get_signing_info(repo_dir)
+
+        assert info == expected
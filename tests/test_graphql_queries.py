@@ -5,12 +5,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 from tenacity import RetryError
 
 from pull_request_fixer.github_client import GitHubClient
+from pull_request_fixer.graphql_cache import GraphQLCache
 from pull_request_fixer.graphql_queries import (
     BULK_PR_COMMITS_TEMPLATE,
     ORG_REPOS_ONLY,
@@ -19,6 +24,7 @@ from pull_request_fixer.graphql_queries import (
     PR_FIRST_COMMIT,
     PR_WITH_STATUS,
     REPO_OPEN_PRS_PAGE,
+    REPO_OPEN_PRS_PAGE_MINIMAL,
 )
 from pull_request_fixer.pr_scanner import PRScanner
 
@@ -26,6 +32,14 @@ from pull_request_fixer.pr_scanner import PRScanner
 class TestGraphQLQueryStructure:
     """Test that GraphQL queries have the correct structure."""
 
+    def test_query_constants_are_interned(self):
+        """Test query constants are interned for identity dispatch."""
+        assert ORG_REPOS_ONLY is sys.intern(ORG_REPOS_ONLY)
+        assert ORG_REPOS_WITH_PRS is sys.intern(ORG_REPOS_WITH_PRS)
+        assert REPO_OPEN_PRS_PAGE_MINIMAL is sys.intern(
+            REPO_OPEN_PRS_PAGE_MINIMAL
+        )
+
     def test_org_repos_only_query_parameters(self):
         """Test ORG_REPOS_ONLY has correct parameters."""
         assert "$org: String!" in ORG_REPOS_ONLY
@@ -49,6 +63,17 @@ class TestGraphQLQueryStructure:
         assert "$prsPageSize: Int!" in REPO_OPEN_PRS_PAGE
         assert "repository(owner: $owner, name: $name)" in REPO_OPEN_PRS_PAGE
 
+    def test_repo_open_prs_page_minimal_omits_unused_fields(self):
+        """Test the minimal variant drops files/comments/reviews."""
+        assert "$owner: String!" in REPO_OPEN_PRS_PAGE_MINIMAL
+        assert "$prsPageSize: Int!" in REPO_OPEN_PRS_PAGE_MINIMAL
+        assert "$contextsPageSize: Int!" in REPO_OPEN_PRS_PAGE_MINIMAL
+        assert "$filesPageSize" not in REPO_OPEN_PRS_PAGE_MINIMAL
+        assert "$commentsPageSize" not in REPO_OPEN_PRS_PAGE_MINIMAL
+        assert "files(" not in REPO_OPEN_PRS_PAGE_MINIMAL
+        assert "comments(" not in REPO_OPEN_PRS_PAGE_MINIMAL
+        assert "reviews(" not in REPO_OPEN_PRS_PAGE_MINIMAL
+
     def test_pr_with_status_query_parameters(self):
         """Test PR_WITH_STATUS has correct parameters."""
         assert "$owner: String!" in PR_WITH_STATUS
@@ -69,11 +94,14 @@ class TestGraphQLQueryStructure:
         assert "$owner: String!" in BULK_PR_COMMITS_TEMPLATE
         assert "$name: String!" in BULK_PR_COMMITS_TEMPLATE
         assert "{pr_queries}" in BULK_PR_COMMITS_TEMPLATE
+        # The shared selection set is declared exactly once
+        assert BULK_PR_COMMITS_TEMPLATE.count("fragment PRCommitFields") == 1
 
     def test_pr_commit_fragment_structure(self):
         """Test PR_COMMIT_FRAGMENT has correct placeholders."""
         assert "pr{number}:" in PR_COMMIT_FRAGMENT
         assert "pullRequest(number: {number})" in PR_COMMIT_FRAGMENT
+        assert "...PRCommitFields" in PR_COMMIT_FRAGMENT
 
 
 @pytest.mark.asyncio
@@ -97,22 +125,72 @@ class TestGitHubClientGraphQL:
             assert "data" not in result
             assert result["organization"]["repositories"]["totalCount"] == 5
 
+    async def test_graphql_body_prefix_cached(self):
+        """Test the serialized query prefix is built once per query."""
+        from pull_request_fixer.github_client import _graphql_body_prefix
+
+        _graphql_body_prefix.cache_clear()
+
+        first = _graphql_body_prefix(ORG_REPOS_ONLY)
+        second = _graphql_body_prefix(ORG_REPOS_ONLY)
+
+        # Same cached bytes object, and it reassembles into valid JSON
+        assert first is second
+        assert _graphql_body_prefix.cache_info().hits == 1
+        body = first + b',"variables":{"org":"test"}}'
+        decoded = orjson.loads(body)
+        assert decoded["query"] == ORG_REPOS_ONLY
+        assert decoded["variables"] == {"org": "test"}
+
+    async def test_http2_enabled_on_default_client(self):
+        """Test that the default client is constructed with HTTP/2."""
+        with patch(
+            "pull_request_fixer.github_client.httpx.AsyncClient"
+        ) as mock_client_cls:
+            GitHubClient(token="test-token")
+
+        assert mock_client_cls.call_args.kwargs["http2"] is True
+
+    async def test_graphql_streams_large_page_responses(self):
+        """Test large-page queries go through the streaming path."""
+        client = GitHubClient(token="test-token")
+        payload = orjson.dumps({"data": {"ok": True}})
+
+        async def _chunks():
+            yield payload[:10]
+            yield payload[10:]
+
+        stream_response = MagicMock()
+        stream_response.is_success = True
+        stream_response.aiter_bytes = _chunks
+
+        stream_cm = MagicMock()
+        stream_cm.__aenter__ = AsyncMock(return_value=stream_response)
+        stream_cm.__aexit__ = AsyncMock(return_value=False)
+
+        with patch.object(client, "_http") as mock_http:
+            mock_http.stream = MagicMock(return_value=stream_cm)
+
+            result = await client.graphql(
+                "query { test }", variables={"prsPageSize": 100}
+            )
+
+        assert result == {"ok": True}
+        mock_http.stream.assert_called_once()
+        mock_http.post.assert_not_called()
+
     async def test_graphql_handles_errors(self):
         """Test that graphql() raises exception on GraphQL errors."""
         client = GitHubClient(token="test-token")
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-
+        with patch.object(client, "_http") as mock_http:
             # Mock response with GraphQL errors
             mock_response = MagicMock()
-            mock_response.json.return_value = {
-                "errors": [{"message": "Not found"}],
-                "data": None,
-            }
+            mock_response.content = orjson.dumps(
+                {"errors": [{"message": "Not found"}], "data": None}
+            )
             mock_response.raise_for_status = MagicMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
+            mock_http.post = AsyncMock(return_value=mock_response)
 
             # The retry logic wraps the FileAccessError in a RetryError
             with pytest.raises(RetryError) as exc_info:
@@ -166,6 +244,31 @@ class TestPRScannerGraphQLUsage:
 
         assert result == 0
 
+    async def test_cached_scanner_reuses_responses(self):
+        """Test that a GraphQLCache dedupes identical scanner queries."""
+        mock_client = AsyncMock(spec=GitHubClient)
+        mock_client.graphql = AsyncMock(
+            return_value={
+                "organization": {
+                    "repositories": {
+                        "totalCount": 10,
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        "nodes": [],
+                    }
+                }
+            }
+        )
+
+        cache = GraphQLCache()
+        scanner = PRScanner(mock_client, progress_tracker=None, cache=cache)
+
+        assert await scanner._count_org_repositories("test-org") == 10
+        assert await scanner._count_org_repositories("test-org") == 10
+
+        # The second invocation is served from the cache
+        assert mock_client.graphql.call_count == 1
+        assert cache.hits == 1
+
     async def test_fetch_repo_prs_uses_correct_params(self):
         """Test _fetch_repo_prs_first_page uses correct parameters."""
         mock_client = AsyncMock(spec=GitHubClient)
@@ -185,16 +288,17 @@ class TestPRScannerGraphQLUsage:
             "owner", "repo"
         )
 
-        # Verify correct parameters
+        # Verify correct parameters; the scanner uses the trimmed query
+        # so the files/comments page sizes are no longer sent
         call_args = mock_client.graphql.call_args
-        assert call_args[0][0] == REPO_OPEN_PRS_PAGE
+        assert call_args[0][0] == REPO_OPEN_PRS_PAGE_MINIMAL
         variables = call_args[1]["variables"]
         assert variables["owner"] == "owner"
         assert variables["name"] == "repo"
         assert "prsPageSize" in variables
-        assert "filesPageSize" in variables
-        assert "commentsPageSize" in variables
         assert "contextsPageSize" in variables
+        assert "filesPageSize" not in variables
+        assert "commentsPageSize" not in variables
 
         # Verify results
         assert len(pr_nodes) == 1
@@ -202,13 +306,12 @@ class TestPRScannerGraphQLUsage:
 
 
 @pytest.mark.asyncio
-@pytest.mark.skip(reason="bulk_check_pr_titles function not implemented")
 class TestBulkPRCommitFetching:
     """Test bulk PR commit fetching functionality."""
 
     async def test_bulk_query_generation(self):
         """Test that bulk query is generated correctly."""
-        # from pull_request_fixer.cli import bulk_check_pr_titles
+        from pull_request_fixer.cli import bulk_check_pr_titles
 
         mock_client = AsyncMock(spec=GitHubClient)
 
@@ -250,47 +353,125 @@ class TestBulkPRCommitFetching:
             }
         )
 
-        # pr_list = [
-        #     {"number": 1, "title": "Wrong title"},
-        #     {"number": 2, "title": "Matching title"},
-        # ]
-        #
-        # result = await bulk_check_pr_titles(
-        #     mock_client, "owner", "repo", pr_list, batch_size=10
-        # )
-        #
-        # # Should only return PR with mismatched title
-        # assert len(result) == 1
-        # assert result[0][0]["number"] == 1
-        # assert result[0][1] == "Wrong title"  # current title
-        # assert result[0][2] == "fix: correct title"  # expected title
-        #
-        # # Verify GraphQL was called with aliased query
-        # call_args = mock_client.graphql.call_args
-        # query = call_args[0][0]
-        # assert "pr1:" in query
-        # assert "pr2:" in query
-        # assert "pullRequest(number: 1)" in query
-        # assert "pullRequest(number: 2)" in query
-        pass  # Test skipped - function not implemented
+        pr_list = [
+            {"number": 1, "title": "Wrong title"},
+            {"number": 2, "title": "Matching title"},
+        ]
+
+        result = await bulk_check_pr_titles(
+            mock_client, "owner", "repo", pr_list, batch_size=10
+        )
+
+        # Should only return PR with mismatched title
+        assert len(result) == 1
+        assert result[0][0]["number"] == 1
+        assert result[0][1] == "Wrong title"  # current title
+        assert result[0][2] == "fix: correct title"  # expected title
+
+        # Verify GraphQL was called with aliased query
+        call_args = mock_client.graphql.call_args
+        query = call_args[0][0]
+        assert "pr1:" in query
+        assert "pr2:" in query
+        assert "pullRequest(number: 1)" in query
+        assert "pullRequest(number: 2)" in query
+
+    async def test_title_normalization_cached(self):
+        """Test duplicate titles are normalized once across all batches."""
+        from pull_request_fixer.cli import (
+            _normalize_title,
+            bulk_check_pr_titles,
+        )
+
+        _normalize_title.cache_clear()
+
+        # Renovate-style corpus: 1000 PRs sharing one title, differing
+        # from the commit headline only in case
+        title = "Chore(deps): Bump Example"
+        headline = "chore(deps): bump example"
+        nodes = {
+            f"pr{i}": {
+                "number": i,
+                "title": title,
+                "commits": {
+                    "nodes": [{"commit": {"messageHeadline": headline}}]
+                },
+            }
+            for i in range(1, 1001)
+        }
+
+        mock_client = AsyncMock(spec=GitHubClient)
+        mock_client.graphql = AsyncMock(return_value={"repository": nodes})
+
+        pr_list = [{"number": i, "title": title} for i in range(1, 1001)]
+
+        result = await bulk_check_pr_titles(
+            mock_client, "owner", "repo", pr_list, batch_size=100
+        )
+
+        # Case-only differences are not mismatches
+        assert result == []
+
+        # Only the two distinct strings were ever normalized
+        info = _normalize_title.cache_info()
+        assert info.misses == 2
+        assert info.hits >= 1998
 
     async def test_bulk_query_batching(self):
         """Test that large PR lists are batched correctly."""
-        # from pull_request_fixer.cli import bulk_check_pr_titles
+        from pull_request_fixer.cli import bulk_check_pr_titles
 
         mock_client = AsyncMock(spec=GitHubClient)
-        mock_client.graphql = AsyncMock(return_value={"repository": {}})
 
-        # # Create 25 PRs - should result in 3 batches (10, 10, 5)
-        # pr_list = [{"number": i, "title": f"PR {i}"} for i in range(1, 26)]
-        #
-        # await bulk_check_pr_titles(
-        #     mock_client, "owner", "repo", pr_list, batch_size=10
-        # )
-        #
-        # # Verify GraphQL was called 3 times (3 batches)
-        # assert mock_client.graphql.call_count == 3
-        pass  # Test skipped - function not implemented
+        in_flight = 0
+        max_in_flight = 0
+
+        async def _graphql(_query, _variables=None):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Yield to the event loop so concurrent batches overlap
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"repository": {}}
+
+        mock_client.graphql = AsyncMock(side_effect=_graphql)
+
+        # Create 25 PRs - should result in 3 batches (10, 10, 5)
+        pr_list = [{"number": i, "title": f"PR {i}"} for i in range(1, 26)]
+
+        await bulk_check_pr_titles(
+            mock_client,
+            "owner",
+            "repo",
+            pr_list,
+            batch_size=10,
+            max_concurrency=2,
+        )
+
+        # Verify GraphQL was called 3 times (3 batches) and the
+        # semaphore kept concurrent batches within bounds
+        assert mock_client.graphql.call_count == 3
+        assert max_in_flight <= 2
+
+
+class _Responder:
+    """Query-keyed async responder for GraphQL mocks.
+
+    Dispatches on query identity in constant time instead of popping a
+    side_effect list per call, and records (query, variables) pairs for
+    assertions.
+    """
+
+    def __init__(self, mapping: dict[str, dict[str, Any]]) -> None:
+        self._mapping = mapping
+        self.calls: list[tuple[str, dict[str, Any] | None]] = []
+
+    async def __call__(
+        self, query: str, variables: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        self.calls.append((query, variables))
+        return self._mapping[query]
 
 
 @pytest.mark.asyncio
@@ -348,12 +529,12 @@ class TestIntegrationScenarios:
             }
         }
 
-        mock_client.graphql = AsyncMock(
-            side_effect=[
-                count_response,
-                repos_with_prs_response,
-                pr_details_response,
-            ]
+        mock_client.graphql = _Responder(
+            {
+                ORG_REPOS_ONLY: count_response,
+                ORG_REPOS_WITH_PRS: repos_with_prs_response,
+                REPO_OPEN_PRS_PAGE_MINIMAL: pr_details_response,
+            }
         )
 
         scanner = PRScanner(mock_client, progress_tracker=None)
@@ -368,6 +549,163 @@ class TestIntegrationScenarios:
         assert prs[0][1] == "repo1"
         assert prs[0][2]["number"] == 1
 
+        # One call per phase: count, repos-with-prs, PR details
+        queries = [query for query, _ in mock_client.graphql.calls]
+        assert queries == [
+            ORG_REPOS_ONLY,
+            ORG_REPOS_WITH_PRS,
+            REPO_OPEN_PRS_PAGE_MINIMAL,
+        ]
+
+    async def test_scan_organization_batched(self):
+        """Test batched scanning yields the same PRs grouped in lists."""
+        mock_client = AsyncMock(spec=GitHubClient)
+
+        count_response = {
+            "organization": {
+                "repositories": {
+                    "totalCount": 1,
+                    "nodes": [
+                        {"nameWithOwner": "org/repo1", "isArchived": False},
+                    ],
+                }
+            }
+        }
+
+        repos_with_prs_response = {
+            "organization": {
+                "repositories": {
+                    "nodes": [
+                        {
+                            "nameWithOwner": "org/repo1",
+                            "name": "repo1",
+                            "owner": {"login": "org"},
+                            "pullRequests": {"totalCount": 5},
+                        }
+                    ],
+                    "pageInfo": {"hasNextPage": False},
+                }
+            }
+        }
+
+        pr_details_response = {
+            "repository": {
+                "pullRequests": {
+                    "nodes": [
+                        {
+                            "number": i,
+                            "title": f"PR {i}",
+                            "isDraft": False,
+                            "body": "",
+                        }
+                        for i in range(1, 6)
+                    ],
+                    "pageInfo": {"hasNextPage": False},
+                }
+            }
+        }
+
+        mock_client.graphql = _Responder(
+            {
+                ORG_REPOS_ONLY: count_response,
+                ORG_REPOS_WITH_PRS: repos_with_prs_response,
+                REPO_OPEN_PRS_PAGE_MINIMAL: pr_details_response,
+            }
+        )
+
+        scanner = PRScanner(mock_client, progress_tracker=None)
+
+        batches = []
+        async for batch in scanner.scan_organization_batched(
+            "org", batch_size=2
+        ):
+            batches.append(batch)
+
+        # 5 PRs with batch_size=2 arrive as 2+2+1
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        numbers = sorted(
+            pr_data["number"] for batch in batches for _, _, pr_data in batch
+        )
+        assert numbers == [1, 2, 3, 4, 5]
+
+    async def test_scan_organization_order_independent(self):
+        """Test results are complete when repo fetches finish out of order."""
+        mock_client = AsyncMock(spec=GitHubClient)
+
+        count_response = {
+            "organization": {
+                "repositories": {
+                    "totalCount": 2,
+                    "nodes": [
+                        {"nameWithOwner": "org/repo1", "isArchived": False},
+                        {"nameWithOwner": "org/repo2", "isArchived": False},
+                    ],
+                }
+            }
+        }
+
+        repos_with_prs_response = {
+            "organization": {
+                "repositories": {
+                    "nodes": [
+                        {
+                            "nameWithOwner": "org/repo1",
+                            "name": "repo1",
+                            "owner": {"login": "org"},
+                            "pullRequests": {"totalCount": 1},
+                        },
+                        {
+                            "nameWithOwner": "org/repo2",
+                            "name": "repo2",
+                            "owner": {"login": "org"},
+                            "pullRequests": {"totalCount": 1},
+                        },
+                    ],
+                    "pageInfo": {"hasNextPage": False},
+                }
+            }
+        }
+
+        def _pr_page(number: int) -> dict[str, Any]:
+            return {
+                "repository": {
+                    "pullRequests": {
+                        "nodes": [
+                            {
+                                "number": number,
+                                "title": f"PR {number}",
+                                "isDraft": False,
+                                "body": "",
+                            }
+                        ],
+                        "pageInfo": {"hasNextPage": False},
+                    }
+                }
+            }
+
+        async def _graphql(query, variables=None):
+            variables = variables or {}
+            if query is ORG_REPOS_ONLY:
+                return count_response
+            if query is ORG_REPOS_WITH_PRS:
+                return repos_with_prs_response
+            # Stall repo1's PR fetch so repo2 completes first
+            if variables.get("name") == "repo1":
+                await asyncio.sleep(0.01)
+                return _pr_page(1)
+            return _pr_page(2)
+
+        mock_client.graphql = AsyncMock(side_effect=_graphql)
+
+        scanner = PRScanner(mock_client, progress_tracker=None)
+
+        prs = []
+        async for owner, repo, pr_data in scanner.scan_organization("org"):
+            prs.append((owner, repo, pr_data["number"]))
+
+        # Both PRs arrive regardless of which repo fetch finished first
+        assert sorted(prs) == [("org", "repo1", 1), ("org", "repo2", 2)]
+
     async def test_empty_organization(self):
         """Test scanning an organization with no repositories."""
         mock_client = AsyncMock(spec=GitHubClient)
@@ -434,6 +772,43 @@ Co-authored-by: Other <other@example.com>"""
         assert "Signed-off-by" not in body
         assert "Co-authored-by" not in body
 
+    @pytest.mark.parametrize(
+        ("trailer_block", "stripped_keys"),
+        [
+            pytest.param(
+                "Reviewed-by: Reviewer <reviewer@example.com>",
+                ["Reviewed-by"],
+                id="reviewed_by",
+            ),
+            pytest.param(
+                "Acked-by: Maintainer <maintainer@example.com>",
+                ["Acked-by"],
+                id="acked_by",
+            ),
+            pytest.param(
+                "Signed-off-by: User <user@example.com>\n"
+                "\n"
+                "Reviewed-by: Reviewer <reviewer@example.com>",
+                ["Signed-off-by", "Reviewed-by"],
+                id="mixed_with_blank_line",
+            ),
+        ],
+    )
+    def test_parse_message_trailer_variants(self, trailer_block, stripped_keys):
+        """Test trailer stripping across different trailer keys."""
+        from pull_request_fixer.cli import parse_commit_message
+
+        message = (
+            f"feat: add new feature\n\nThis is the body.\n\n{trailer_block}"
+        )
+
+        subject, body = parse_commit_message(message)
+
+        assert subject == "feat: add new feature"
+        assert "This is the body" in body
+        for key in stripped_keys:
+            assert key not in body
+
     def test_parse_message_subject_only(self):
         """Test parsing a commit with only a subject line."""
         from pull_request_fixer.cli import parse_commit_message